@@ -12,11 +12,23 @@ from pathlib import Path
 
 DATA_FILE = Path(__file__).parent / "data" / "quota.json"
 
+# Parsed quota.json, keyed by (st_mtime_ns, st_size) so edits invalidate it
+_DATA_CACHE = {}
+
 def load_data():
     DATA_FILE.parent.mkdir(exist_ok=True)
-    if DATA_FILE.exists():
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+    try:
+        st = DATA_FILE.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        key = (st.st_mtime_ns, st.st_size)
+        if _DATA_CACHE.get("key") == key:
+            return _DATA_CACHE["val"]
+        with open(DATA_FILE, "rb") as f:
+            val = json.loads(f.read())
+        _DATA_CACHE.update(key=key, val=val)
+        return val
     return {
         "coding_plan": {
             "total_prompts": 5000,  # Default for Pro plan
@@ -27,8 +39,11 @@ def load_data():
 
 def save_data(data):
     DATA_FILE.parent.mkdir(exist_ok=True)
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Write compactly to a temp file and swap it in so readers never see a torn file
+    tmp = DATA_FILE.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp, DATA_FILE)
 
 def update_prompts(remaining):
     data = load_data()
@@ -37,6 +52,43 @@ def update_prompts(remaining):
     save_data(data)
     print(f"✅ 已更新：剩余 {remaining} prompts")
 
+_REPORT_TEMPLATE = """\
+{sep}
+📊 OpenClaw 配額報告 (Coding Plan)
+📅 查詢時間：{now}
+{sep}
+
+🔵 MiniMax Coding Plan
+{rule}
+   方案：Pro (5000 prompts/5hr)
+   配額：{total} prompts / 5小時
+   -----------------------------------
+{plan_status}
+
+🦅 Claude Pro (阿鷹)
+{rule}
+   方案：Claude Pro 訂閱
+   狀態：✅ 無用量限制
+
+🐉 Gemini Pro (小龍)
+{rule}
+   方案：Google AI Pro 訂閱
+   狀態：✅ 無用量限制
+
+{sep}
+💡 使用方式：
+   1. 訪問 https://platform.minimax.io/user-center/payment/coding-plan
+   2. 查看剩餘 prompts
+   3. 輸入指令更新：quota-tracker.py update <數字>
+{sep}"""
+
+_REPORT_PLAN_SET = """\
+   剩餘：{remaining} prompts
+   已用：{used} prompts ({pct:.1f}%)
+   更新：{last}"""
+
+_REPORT_PLAN_UNSET = "   ⚠️  尚未設定，請輸入剩餘prompts"
+
 def generate_report():
     data = load_data()
     cp = data.get("coding_plan", {})
@@ -49,65 +101,42 @@ def generate_report():
     if remaining != "未設定" and remaining is not None:
         used = total - remaining
         pct = (used / total) * 100
+        plan_status = _REPORT_PLAN_SET.format(remaining=remaining, used=used, pct=pct, last=last)
     else:
-        used = "未知"
-        pct = 0
-    
-    report = []
-    report.append("=" * 60)
-    report.append("📊 OpenClaw 配額報告 (Coding Plan)")
-    report.append(f"📅 查詢時間：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("=" * 60)
+        plan_status = _REPORT_PLAN_UNSET
     
-    # MiniMax Coding Plan
-    report.append("\n🔵 MiniMax Coding Plan")
-    report.append("-" * 40)
-    report.append(f"   方案：Pro (5000 prompts/5hr)")
-    report.append(f"   配額：{total} prompts / 5小時")
-    report.append(f"   -----------------------------------")
-    if remaining != "未設定" and remaining is not None:
-        report.append(f"   剩餘：{remaining} prompts")
-        report.append(f"   已用：{used} prompts ({pct:.1f}%)")
-        report.append(f"   更新：{last}")
+    return _REPORT_TEMPLATE.format(
+        sep="=" * 60,
+        rule="-" * 40,
+        now=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        total=total,
+        plan_status=plan_status,
+    )
+
+def cmd_report(args):
+    sys.stdout.write(generate_report() + "\n")
+
+def cmd_update(args):
+    if args:
+        update_prompts(int(args[0]))
     else:
-        report.append(f"   ⚠️  尚未設定，請輸入剩餘prompts")
-    
-    # Claude Pro
-    report.append("\n🦅 Claude Pro (阿鷹)")
-    report.append("-" * 40)
-    report.append(f"   方案：Claude Pro 訂閱")
-    report.append(f"   狀態：✅ 無用量限制")
-    
-    # Gemini Pro
-    report.append("\n🐉 Gemini Pro (小龍)")
-    report.append("-" * 40)
-    report.append(f"   方案：Google AI Pro 訂閱")
-    report.append(f"   狀態：✅ 無用量限制")
-    
-    report.append("\n" + "=" * 60)
-    report.append("💡 使用方式：")
-    report.append("   1. 訪問 https://platform.minimax.io/user-center/payment/coding-plan")
-    report.append("   2. 查看剩餘 prompts")
-    report.append("   3. 輸入指令更新：quota-tracker.py update <數字>")
-    report.append("=" * 60)
-    
-    return "\n".join(report)
+        print("用法: quota-tracker.py update <剩餘prompts>")
+
+COMMANDS = {
+    "report": cmd_report,
+    "update": cmd_update,
+}
 
 def main():
-    if len(sys.argv) > 1:
-        cmd = sys.argv[1]
-        if cmd == "report":
-            print(generate_report())
-        elif cmd == "update":
-            if len(sys.argv) > 2:
-                remaining = int(sys.argv[2])
-                update_prompts(remaining)
-            else:
-                print("用法: quota-tracker.py update <剩餘prompts>")
-        else:
-            print(f"未知指令：{cmd}")
-    else:
-        print(generate_report())
+    argv = sys.argv
+    if len(argv) < 2:
+        cmd_report(argv[2:])
+        return
+    fn = COMMANDS.get(argv[1])
+    if fn is None:
+        print(f"未知指令：{argv[1]}")
+        return
+    fn(argv[2:])
 
 if __name__ == "__main__":
     main()